@@ -1,9 +1,6 @@
 """PolicyEngine SNAP Screener Validation Package"""
 
-from .calculator import SNAPHousehold, SNAPScreenerCalculator
-from .policyengine import PolicyEngineCalculator
-from .scraper import SNAPScreenerScraper
-from .validator import SNAPValidator
+import importlib
 
 __version__ = "0.1.0"
 __all__ = [
@@ -13,3 +10,25 @@ __all__ = [
     "SNAPValidator",
     "SNAPScreenerScraper",
 ]
+
+# Submodule defining each public name, imported on first access
+_MODULES = {
+    "SNAPHousehold": ".calculator",
+    "SNAPScreenerCalculator": ".calculator",
+    "PolicyEngineCalculator": ".policyengine",
+    "SNAPValidator": ".validator",
+    "SNAPScreenerScraper": ".scraper",
+}
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,13 @@
 """SNAP Screener calculation methodology implementation"""
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
 
+import numpy as np
+from numba import boolean, float64, guvectorize, int64, njit
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SNAPHousehold:
     """Represents a household for SNAP calculations"""
 
@@ -20,50 +23,201 @@ class SNAPHousehold:
     state: str = "CA"
 
 
+@njit(cache=True)
+def _get_limit(household_size, table):
+    """Get limit for household size, extrapolating if needed."""
+    if household_size <= 8:
+        return table[max(household_size, 0)]
+
+    # For households larger than 8, add amount per additional person
+    return table[8] + (household_size - 8) * (table[8] - table[7])
+
+
+@njit(cache=True)
+def _snap_core(
+    size,
+    earned,
+    unearned,
+    rent,
+    dep_care,
+    child_support,
+    medical,
+    elderly,
+    utility,
+    std_ded,
+    max_allot,
+    gross_lim,
+    net_lim,
+    shelter_cap,
+    earned_deduction_rate,
+):
+    """Screener arithmetic for a single household, compiled by Numba."""
+    gross_income = earned + unearned
+    gross_limit = _get_limit(size, gross_lim)
+
+    standard_deduction = _get_limit(size, std_ded)
+    earned_income_deduction = earned * earned_deduction_rate
+
+    # Medical expense deduction (only for elderly/disabled, over $35)
+    medical_deduction = 0.0
+    if elderly and medical > 35:
+        medical_deduction = medical - 35
+
+    adjusted_income = (
+        gross_income
+        - standard_deduction
+        - earned_income_deduction
+        - dep_care
+        - child_support
+        - medical_deduction
+    )
+
+    half_adjusted_income = adjusted_income / 2
+
+    total_shelter_costs = rent
+    if utility:
+        total_shelter_costs += 500  # Approximate SUA
+
+    excess_shelter = max(0.0, total_shelter_costs - half_adjusted_income)
+
+    # Apply cap if no elderly/disabled member
+    if not elderly:
+        excess_shelter = min(excess_shelter, shelter_cap)
+
+    net_income = adjusted_income - excess_shelter
+    net_limit = _get_limit(size, net_lim)
+
+    max_allotment = _get_limit(size, max_allot)
+    expected_contribution = max(0.0, net_income * 0.30)
+    benefit_amount = round(max(0.0, max_allotment - expected_contribution))
+
+    return (
+        gross_income,
+        gross_limit,
+        standard_deduction,
+        earned_income_deduction,
+        medical_deduction,
+        adjusted_income,
+        excess_shelter,
+        net_income,
+        net_limit,
+        max_allotment,
+        expected_contribution,
+        benefit_amount,
+    )
+
+
+@guvectorize(
+    [
+        (
+            int64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            float64,
+            boolean,
+            boolean,
+            int64[:],
+            int64[:],
+            int64[:],
+            int64[:],
+            float64,
+            float64,
+        )
+        + (float64[:],) * 12
+    ],
+    "(),(),(),(),(),(),(),(),(),(m),(m),(m),(m),(),()->"
+    "(),(),(),(),(),(),(),(),(),(),(),()",
+    target="parallel",
+    cache=True,
+)
+def _snap_batch(
+    size,
+    earned,
+    unearned,
+    rent,
+    dep_care,
+    child_support,
+    medical,
+    elderly,
+    utility,
+    std_ded,
+    max_allot,
+    gross_lim,
+    net_lim,
+    shelter_cap,
+    earned_deduction_rate,
+    gross_income,
+    gross_limit,
+    standard_deduction,
+    earned_income_deduction,
+    medical_deduction,
+    adjusted_income,
+    excess_shelter,
+    net_income,
+    net_limit,
+    max_allotment,
+    expected_contribution,
+    benefit_amount,
+):
+    """Run the screener kernel for one household of a batch.
+
+    Household fields are scalar core dimensions, so the parallel target
+    spreads the households themselves across threads.
+    """
+    (
+        gross_income[0],
+        gross_limit[0],
+        standard_deduction[0],
+        earned_income_deduction[0],
+        medical_deduction[0],
+        adjusted_income[0],
+        excess_shelter[0],
+        net_income[0],
+        net_limit[0],
+        max_allotment[0],
+        expected_contribution[0],
+        benefit_amount[0],
+    ) = _snap_core(
+        size,
+        earned,
+        unearned,
+        rent,
+        dep_care,
+        child_support,
+        medical,
+        elderly,
+        utility,
+        std_ded,
+        max_allot,
+        gross_lim,
+        net_lim,
+        shelter_cap,
+        earned_deduction_rate,
+    )
+
+
 class SNAPScreenerCalculator:
     """
     Implements SNAP screener calculation methodology.
     Based on 2024 federal SNAP rules and deductions.
     """
 
+    # Tables below are indexed by household size (index 0 unused)
+
     # 2024 Standard deductions by household size
-    STANDARD_DEDUCTIONS = {1: 198, 2: 198, 3: 198, 4: 217, 5: 255, 6: 294}
+    STANDARD_DEDUCTIONS = (0, 198, 198, 198, 217, 255, 294, 294, 294)
 
     # 2024 Maximum allotments by household size
-    MAX_ALLOTMENTS = {
-        1: 292,
-        2: 536,
-        3: 768,
-        4: 975,
-        5: 1158,
-        6: 1390,
-        7: 1536,
-        8: 1756,
-    }
+    MAX_ALLOTMENTS = (0, 292, 536, 768, 975, 1158, 1390, 1536, 1756)
 
     # 2024 Gross income limits (130% of poverty)
-    GROSS_INCOME_LIMITS = {
-        1: 1632,
-        2: 2198,
-        3: 2765,
-        4: 3331,
-        5: 3897,
-        6: 4463,
-        7: 5030,
-        8: 5596,
-    }
+    GROSS_INCOME_LIMITS = (0, 1632, 2198, 2765, 3331, 3897, 4463, 5030, 5596)
 
     # 2024 Net income limits (100% of poverty)
-    NET_INCOME_LIMITS = {
-        1: 1255,
-        2: 1691,
-        3: 2127,
-        4: 2563,
-        5: 2998,
-        6: 3434,
-        7: 3870,
-        8: 4305,
-    }
+    NET_INCOME_LIMITS = (0, 1255, 1691, 2127, 2563, 2998, 3434, 3870, 4305)
 
     # Excess shelter deduction cap (for non-elderly/disabled households)
     EXCESS_SHELTER_CAP = 624
@@ -71,90 +225,196 @@ class SNAPScreenerCalculator:
     # Earned income deduction rate
     EARNED_INCOME_DEDUCTION_RATE = 0.20
 
+    # Array copies of the tables for the compiled kernels
+    _STANDARD_DEDUCTION_TABLE = np.array(STANDARD_DEDUCTIONS, dtype=np.int64)
+    _MAX_ALLOTMENT_TABLE = np.array(MAX_ALLOTMENTS, dtype=np.int64)
+    _GROSS_INCOME_TABLE = np.array(GROSS_INCOME_LIMITS, dtype=np.int64)
+    _NET_INCOME_TABLE = np.array(NET_INCOME_LIMITS, dtype=np.int64)
+
+    # calculate_batch argument for each SNAPHousehold field
+    BATCH_ARGUMENTS = {
+        "sizes": "size",
+        "earned_income": "monthly_earned_income",
+        "unearned_income": "monthly_unearned_income",
+        "rent": "monthly_rent",
+        "dependent_care": "monthly_dependent_care",
+        "child_support": "monthly_child_support",
+        "medical_expenses": "monthly_medical_expenses",
+        "has_elderly_disabled": "has_elderly_disabled",
+        "has_utility_expenses": "has_utility_expenses",
+    }
+
     def __init__(self):
         pass
 
-    def calculate(self, household: SNAPHousehold) -> Dict:
+    def calculate(
+        self,
+        household: SNAPHousehold,
+        unearned_income_override: Optional[float] = None,
+    ) -> Dict:
         """
         Calculate SNAP benefits using screener methodology.
 
+        Args:
+            household: Household configuration
+            unearned_income_override: Monthly unearned income to use in
+                place of the household's, e.g. with TANF added
+
         Returns:
             Dictionary with calculation details and benefit amount
         """
-        # Step 1: Calculate gross income
-        gross_income = (
-            household.monthly_earned_income + household.monthly_unearned_income
+        unearned_income = (
+            household.monthly_unearned_income
+            if unearned_income_override is None
+            else unearned_income_override
         )
 
-        # Step 2: Check gross income eligibility
-        gross_limit = self._get_limit(household.size, self.GROSS_INCOME_LIMITS)
-        passes_gross_test = gross_income <= gross_limit
-
-        # Step 3: Calculate deductions
-        standard_deduction = self._get_limit(
-            household.size, self.STANDARD_DEDUCTIONS
+        (
+            gross_income,
+            gross_limit,
+            standard_deduction,
+            earned_income_deduction,
+            medical_deduction,
+            adjusted_income,
+            excess_shelter,
+            net_income,
+            net_limit,
+            max_allotment,
+            expected_contribution,
+            benefit_amount,
+        ) = _snap_core(
+            int(household.size),
+            float(household.monthly_earned_income),
+            float(unearned_income),
+            float(household.monthly_rent),
+            float(household.monthly_dependent_care),
+            float(household.monthly_child_support),
+            float(household.monthly_medical_expenses),
+            bool(household.has_elderly_disabled),
+            bool(household.has_utility_expenses),
+            self._STANDARD_DEDUCTION_TABLE,
+            self._MAX_ALLOTMENT_TABLE,
+            self._GROSS_INCOME_TABLE,
+            self._NET_INCOME_TABLE,
+            self.EXCESS_SHELTER_CAP,
+            self.EARNED_INCOME_DEDUCTION_RATE,
         )
 
-        earned_income_deduction = (
-            household.monthly_earned_income * self.EARNED_INCOME_DEDUCTION_RATE
-        )
-
-        # Medical expense deduction (only for elderly/disabled, over $35)
-        medical_deduction = 0
-        if (
-            household.has_elderly_disabled
-            and household.monthly_medical_expenses > 35
-        ):
-            medical_deduction = household.monthly_medical_expenses - 35
-
-        # Step 4: Calculate adjusted income
-        adjusted_income = (
-            gross_income
-            - standard_deduction
-            - earned_income_deduction
-            - household.monthly_dependent_care
-            - household.monthly_child_support
-            - medical_deduction
-        )
+        passes_gross_test = gross_income <= gross_limit
+        passes_net_test = net_income <= net_limit
 
-        # Step 5: Calculate excess shelter deduction
-        half_adjusted_income = adjusted_income / 2
+        return {
+            "gross_income": gross_income,
+            "gross_income_limit": gross_limit,
+            "passes_gross_test": passes_gross_test,
+            "standard_deduction": standard_deduction,
+            "earned_income_deduction": earned_income_deduction,
+            "dependent_care_deduction": household.monthly_dependent_care,
+            "child_support_deduction": household.monthly_child_support,
+            "medical_deduction": medical_deduction,
+            "adjusted_income": adjusted_income,
+            "excess_shelter_deduction": excess_shelter,
+            "net_income": net_income,
+            "net_income_limit": net_limit,
+            "passes_net_test": passes_net_test,
+            "max_allotment": max_allotment,
+            "expected_contribution": expected_contribution,
+            "benefit_amount": benefit_amount,
+            "is_eligible": passes_gross_test
+            and passes_net_test
+            and benefit_amount > 0,
+        }
 
-        total_shelter_costs = household.monthly_rent
-        if household.has_utility_expenses:
-            # Add standard utility allowance (varies by state)
-            # Using simplified amount for demonstration
-            total_shelter_costs += 500  # Approximate SUA
+    def calculate_batch(
+        self,
+        sizes: np.ndarray,
+        earned_income: np.ndarray,
+        unearned_income: np.ndarray,
+        rent: np.ndarray,
+        dependent_care: np.ndarray = 0,
+        child_support: np.ndarray = 0,
+        medical_expenses: np.ndarray = 0,
+        has_elderly_disabled: np.ndarray = False,
+        has_utility_expenses: np.ndarray = False,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate SNAP benefits for many households at once.
 
-        excess_shelter = max(0, total_shelter_costs - half_adjusted_income)
+        Each argument holds one value per household (scalars are
+        broadcast, so an all-scalar call is a batch of one), mirroring
+        the fields of SNAPHousehold.
 
-        # Apply cap if no elderly/disabled member
-        if not household.has_elderly_disabled:
-            excess_shelter = min(excess_shelter, self.EXCESS_SHELTER_CAP)
+        Returns:
+            Dictionary of arrays with calculation details and benefit
+            amounts, keyed like the result of calculate()
+        """
+        (
+            sizes,
+            earned_income,
+            unearned_income,
+            rent,
+            dependent_care,
+            child_support,
+            medical_expenses,
+            has_elderly_disabled,
+            has_utility_expenses,
+        ) = np.atleast_1d(
+            *np.broadcast_arrays(
+                np.asarray(sizes, dtype=np.int64),
+                np.asarray(earned_income, dtype=float),
+                np.asarray(unearned_income, dtype=float),
+                np.asarray(rent, dtype=float),
+                np.asarray(dependent_care, dtype=float),
+                np.asarray(child_support, dtype=float),
+                np.asarray(medical_expenses, dtype=float),
+                np.asarray(has_elderly_disabled, dtype=bool),
+                np.asarray(has_utility_expenses, dtype=bool),
+            )
+        )
 
-        # Step 6: Calculate net income
-        net_income = adjusted_income - excess_shelter
+        (
+            gross_income,
+            gross_limit,
+            standard_deduction,
+            earned_income_deduction,
+            medical_deduction,
+            adjusted_income,
+            excess_shelter,
+            net_income,
+            net_limit,
+            max_allotment,
+            expected_contribution,
+            benefit_amount,
+        ) = _snap_batch(
+            sizes,
+            earned_income,
+            unearned_income,
+            rent,
+            dependent_care,
+            child_support,
+            medical_expenses,
+            has_elderly_disabled,
+            has_utility_expenses,
+            self._STANDARD_DEDUCTION_TABLE,
+            self._MAX_ALLOTMENT_TABLE,
+            self._GROSS_INCOME_TABLE,
+            self._NET_INCOME_TABLE,
+            self.EXCESS_SHELTER_CAP,
+            self.EARNED_INCOME_DEDUCTION_RATE,
+        )
 
-        # Step 7: Check net income eligibility
-        net_limit = self._get_limit(household.size, self.NET_INCOME_LIMITS)
+        benefit_amount = benefit_amount.astype(np.int64)
+        passes_gross_test = gross_income <= gross_limit
         passes_net_test = net_income <= net_limit
 
-        # Step 8: Calculate benefit amount
-        max_allotment = self._get_limit(household.size, self.MAX_ALLOTMENTS)
-        expected_contribution = max(0, net_income * 0.30)
-        benefit_amount = max(0, max_allotment - expected_contribution)
-
-        # Round benefit to nearest dollar
-        benefit_amount = round(benefit_amount)
-
         return {
             "gross_income": gross_income,
             "gross_income_limit": gross_limit,
             "passes_gross_test": passes_gross_test,
             "standard_deduction": standard_deduction,
             "earned_income_deduction": earned_income_deduction,
-            "dependent_care_deduction": household.monthly_dependent_care,
-            "child_support_deduction": household.monthly_child_support,
+            "dependent_care_deduction": dependent_care,
+            "child_support_deduction": child_support,
             "medical_deduction": medical_deduction,
             "adjusted_income": adjusted_income,
             "excess_shelter_deduction": excess_shelter,
@@ -165,22 +425,6 @@ class SNAPScreenerCalculator:
             "expected_contribution": expected_contribution,
             "benefit_amount": benefit_amount,
             "is_eligible": passes_gross_test
-            and passes_net_test
-            and benefit_amount > 0,
+            & passes_net_test
+            & (benefit_amount > 0),
         }
-
-    def _get_limit(
-        self, household_size: int, limits: Dict[int, float]
-    ) -> float:
-        """Get limit for household size, extrapolating if needed."""
-        if household_size in limits:
-            return limits[household_size]
-
-        # For households larger than 8, add amount per additional person
-        if household_size > 8:
-            base = limits[8]
-            # Approximate additional amount per person
-            per_person = limits[8] - limits[7]
-            return base + (household_size - 8) * per_person
-
-        return 0
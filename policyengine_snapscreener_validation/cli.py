@@ -1,16 +1,35 @@
 """Command-line interface for SNAP validation"""
 
-import json
+import sys
 
 import click
+import orjson
 from rich.console import Console
 
 from .calculator import SNAPHousehold
-from .validator import SNAPValidator
 
 console = Console()
 
 
+def _print_json(data) -> None:
+    """Print data as indented JSON, highlighted only on a terminal."""
+    payload = orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_APPEND_NEWLINE,
+    )
+
+    if console.is_terminal:
+        console.print_json(payload.decode())
+    else:
+        # Piped output skips rich's re-parse and styling entirely
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.flush()
+
+
 @click.group()
 def main():
     """PolicyEngine SNAP Screener Validation Tool"""
@@ -74,6 +93,8 @@ def compare(
 ):
     """Compare SNAP benefits between PolicyEngine and SNAP screener"""
 
+    from .validator import SNAPValidator
+
     # Create household
     household = SNAPHousehold(
         size=size,
@@ -83,21 +104,19 @@ def compare(
         state=state,
     )
 
-    # Create validator
-    validator = SNAPValidator(use_scraper=scrape)
-
-    # Run comparison
-    result = validator.validate_single(
-        household,
-        year=year,
-        include_tanf=not no_tanf,
-        trigger_sua=with_sua,
-        use_scraper=scrape,
-    )
+    # Create validator and run comparison
+    with SNAPValidator(use_scraper=scrape) as validator:
+        result = validator.validate_single(
+            household,
+            year=year,
+            include_tanf=not no_tanf,
+            trigger_sua=with_sua,
+            use_scraper=scrape,
+        )
 
     if output_json:
         # Output as JSON
-        console.print_json(json.dumps(result, indent=2, default=str))
+        _print_json(result)
     else:
         # Print formatted comparison
         validator.print_comparison(result)
@@ -124,9 +143,11 @@ def compare(
 def batch(scenarios, year, output):
     """Run batch validation from scenarios file"""
 
+    from .validator import SNAPValidator
+
     # Load scenarios
-    with open(scenarios, "r") as f:
-        scenarios_data = json.load(f)
+    with open(scenarios, "rb") as f:
+        scenarios_data = orjson.loads(f.read())
 
     # Create validator
     validator = SNAPValidator()
@@ -213,7 +234,7 @@ def examples():
         },
     ]
 
-    console.print_json(json.dumps(example_scenarios, indent=2))
+    _print_json(example_scenarios)
 
 
 @main.command()
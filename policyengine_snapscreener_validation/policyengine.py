@@ -1,11 +1,135 @@
 """PolicyEngine US calculation wrapper"""
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List, Union
 
-from policyengine_us import Simulation
+import numpy as np
+import orjson
 
 from .calculator import SNAPHousehold
 
+# SPM unit variables reported for each household
+SNAP_VARIABLES = (
+    "tanf",
+    "snap_earned_income",
+    "snap_unearned_income",
+    "snap_gross_income",
+    "snap_standard_deduction",
+    "snap_earned_income_deduction",
+    "snap_utility_allowance",
+    "housing_cost",
+    "snap_excess_shelter_expense_deduction",
+    "snap_net_income",
+    "snap_max_allotment",
+    "snap_expected_contribution",
+    "snap",
+    "meets_snap_gross_income_test",
+    "meets_snap_net_income_test",
+    "meets_snap_asset_test",
+    "is_snap_eligible",
+)
+
+# Monthly result keys and the annual SPM unit variables they come from
+MONTHLY_OUTPUTS = {
+    "gross_income": "snap_gross_income",
+    "standard_deduction": "snap_standard_deduction",
+    "earned_income_deduction": "snap_earned_income_deduction",
+    "utility_allowance": "snap_utility_allowance",
+    "housing_cost": "housing_cost",
+    "excess_shelter_deduction": "snap_excess_shelter_expense_deduction",
+    "net_income": "snap_net_income",
+    "max_allotment": "snap_max_allotment",
+    "expected_contribution": "snap_expected_contribution",
+    "benefit_amount": "snap",
+}
+
+
+@lru_cache(maxsize=1024)
+def _situation_json(
+    household: SNAPHousehold, year: int, trigger_sua: bool
+) -> bytes:
+    """Build the serialized PolicyEngine situation for a household."""
+    year_str = str(year)
+    income_annual = household.monthly_earned_income * 12
+    rent_annual = household.monthly_rent * 12
+    child_names = [f"child{i + 1}" for i in range(household.size - 2)]
+
+    # Distribute income between two parents if household size > 1
+    if household.size >= 2:
+        parent1_income = income_annual / 2
+        parent2_income = income_annual / 2
+    else:
+        parent1_income = income_annual
+        parent2_income = 0
+
+    # Build people dictionary
+    people = {
+        "parent1": {
+            "age": {year_str: 30},
+            "employment_income": {year_str: parent1_income},
+            "pre_subsidy_rent": {year_str: rent_annual},
+        }
+    }
+
+    members = ["parent1"]
+
+    if household.size >= 2:
+        people["parent2"] = {
+            "age": {year_str: 30},
+            "employment_income": {year_str: parent2_income},
+        }
+        members.append("parent2")
+
+    # Add children if needed (default age for children)
+    people.update({name: {"age": {year_str: 5}} for name in child_names})
+    members.extend(child_names)
+
+    # Build marital units
+    marital_units = {"marital_unit": {"members": members[:2]}}
+
+    # Add children to separate marital units
+    marital_units.update(
+        {
+            f"marital_unit_{i + 2}": {"members": [name]}
+            for i, name in enumerate(child_names)
+        }
+    )
+
+    # Build SPM unit
+    spm_units = {
+        "spm_unit": {
+            "members": members,
+            "snap_emergency_allotment": {year_str: False},
+        }
+    }
+
+    # Add heating/cooling expense if we want to trigger SUA
+    if trigger_sua:
+        spm_units["spm_unit"]["heating_cooling_expense"] = {year_str: 1}
+
+    # Add dependent care if specified
+    if household.monthly_dependent_care > 0:
+        spm_units["spm_unit"]["childcare_expenses"] = {
+            year_str: household.monthly_dependent_care * 12
+        }
+
+    # Build complete situation
+    situation = {
+        "people": people,
+        "families": {"family": {"members": members}},
+        "marital_units": marital_units,
+        "tax_units": {"tax_unit": {"members": members}},
+        "spm_units": spm_units,
+        "households": {
+            "household": {
+                "members": members,
+                "state_code": {year_str: household.state},
+            }
+        },
+    }
+
+    return orjson.dumps(situation, option=orjson.OPT_SERIALIZE_NUMPY)
+
 
 class PolicyEngineCalculator:
     """Wrapper for PolicyEngine US SNAP calculations"""
@@ -32,160 +156,140 @@ class PolicyEngineCalculator:
         Returns:
             Dictionary with calculation details and benefit amount
         """
-        # Build simulation situation
-        situation = self._build_situation(household, year, trigger_sua)
+        # Copied so callers can't modify the memoized result
+        return dict(
+            _calculate_single(household, year, include_tanf, trigger_sua)
+        )
 
-        # Create simulation
-        sim = Simulation(situation=situation)
+    def calculate_batch(
+        self,
+        households: List[SNAPHousehold],
+        year: int = 2025,
+        include_tanf: Union[bool, List[bool]] = True,
+        trigger_sua: Union[bool, List[bool]] = False,
+    ) -> List[Dict]:
+        """
+        Calculate SNAP benefits for many households in one simulation.
 
-        # Calculate key values
-        employment_income = sum(sim.calculate("employment_income", year))
-        tanf = sim.calculate("tanf", year)[0] if include_tanf else 0
-
-        snap_earned_income = sim.calculate("snap_earned_income", year)[0]
-        snap_unearned_income = sim.calculate("snap_unearned_income", year)[0]
-        snap_gross_income = sim.calculate("snap_gross_income", year)[0]
-
-        snap_standard_deduction = sim.calculate(
-            "snap_standard_deduction", year
-        )[0]
-        snap_earned_income_deduction = sim.calculate(
-            "snap_earned_income_deduction", year
-        )[0]
-        snap_utility_allowance = sim.calculate("snap_utility_allowance", year)[
-            0
-        ]
-        housing_cost = sim.calculate("housing_cost", year)[0]
-        snap_excess_shelter_expense_deduction = sim.calculate(
-            "snap_excess_shelter_expense_deduction", year
-        )[0]
-
-        snap_net_income = sim.calculate("snap_net_income", year)[0]
-        snap_max_allotment = sim.calculate("snap_max_allotment", year)[0]
-        snap_expected_contribution = sim.calculate(
-            "snap_expected_contribution", year
-        )[0]
-        snap_benefit = sim.calculate("snap", year)[0]
-
-        # Check eligibility
-        meets_gross_test = sim.calculate("meets_snap_gross_income_test", year)[
-            0
-        ]
-        meets_net_test = sim.calculate("meets_snap_net_income_test", year)[0]
-        meets_asset_test = sim.calculate("meets_snap_asset_test", year)[0]
-        is_eligible = sim.calculate("is_snap_eligible", year)[0]
-
-        return {
-            "year": year,
-            "employment_income": employment_income,
-            "tanf_benefit": tanf,
-            "snap_earned_income": snap_earned_income,
-            "snap_unearned_income": snap_unearned_income,
-            "gross_income": snap_gross_income / 12,  # Convert to monthly
-            "standard_deduction": snap_standard_deduction / 12,
-            "earned_income_deduction": snap_earned_income_deduction / 12,
-            "utility_allowance": snap_utility_allowance / 12,
-            "housing_cost": housing_cost / 12,
-            "excess_shelter_deduction": snap_excess_shelter_expense_deduction
-            / 12,
-            "net_income": snap_net_income / 12,
-            "max_allotment": snap_max_allotment / 12,
-            "expected_contribution": snap_expected_contribution / 12,
-            "benefit_amount": snap_benefit / 12,  # Monthly benefit
-            "annual_benefit": snap_benefit,
-            "meets_gross_test": bool(meets_gross_test),
-            "meets_net_test": bool(meets_net_test),
-            "meets_asset_test": bool(meets_asset_test),
-            "is_eligible": bool(is_eligible),
-        }
+        Args:
+            households: Household configurations
+            year: Tax year for calculation
+            include_tanf: Whether to allow TANF calculation, either for
+                all households or one flag per household
+            trigger_sua: Whether to trigger Standard Utility Allowance,
+                either for all households or one flag per household
 
-    def _build_situation(
-        self, household: SNAPHousehold, year: int, trigger_sua: bool
-    ) -> Dict:
-        """Build PolicyEngine simulation situation from household data."""
+        Returns:
+            List of dictionaries with calculation details and benefit
+            amount, one per household
+        """
+        if not households:
+            return []
 
-        # Distribute income between two parents if household size > 1
-        if household.size >= 2:
-            parent1_income = household.monthly_earned_income * 12 / 2
-            parent2_income = household.monthly_earned_income * 12 / 2
-        else:
-            parent1_income = household.monthly_earned_income * 12
-            parent2_income = 0
-
-        # Build people dictionary
-        people = {
-            "parent1": {
-                "age": {str(year): 30},
-                "employment_income": {str(year): parent1_income},
-                "pre_subsidy_rent": {str(year): household.monthly_rent * 12},
-            }
-        }
+        if isinstance(include_tanf, bool):
+            include_tanf = [include_tanf] * len(households)
+        if isinstance(trigger_sua, bool):
+            trigger_sua = [trigger_sua] * len(households)
 
-        members = ["parent1"]
+        # Imported here so screener-only users skip loading the US system
+        from policyengine_us import Simulation
 
-        if household.size >= 2:
-            people["parent2"] = {
-                "age": {str(year): 30},
-                "employment_income": {str(year): parent2_income},
-            }
-            members.append("parent2")
+        # Build one simulation containing every household
+        situation = self._build_batch_situation(households, year, trigger_sua)
+        sim = Simulation(situation=situation)
 
-        # Add children if needed
-        for i in range(household.size - 2):
-            child_name = f"child{i+1}"
-            people[child_name] = {
-                "age": {str(year): 5}  # Default age for children
-            }
-            members.append(child_name)
-
-        # Build marital units
-        marital_units = {}
-        if household.size >= 2:
-            marital_units["marital_unit"] = {"members": ["parent1", "parent2"]}
-            marital_unit_counter = 2
-        else:
-            marital_units["marital_unit"] = {"members": ["parent1"]}
-            marital_unit_counter = 2
-
-        # Add children to separate marital units
-        for i in range(household.size - 2):
-            child_name = f"child{i+1}"
-            marital_units[f"marital_unit_{marital_unit_counter}"] = {
-                "members": [child_name]
-            }
-            marital_unit_counter += 1
+        # Read key values, one entry per SPM unit
+        values = {var: sim.calculate(var, year) for var in SNAP_VARIABLES}
+        employment_income = sim.calculate(
+            "employment_income", year, map_to="spm_unit"
+        )
 
-        # Build SPM unit
-        spm_units = {
-            "spm_unit": {
-                "members": members,
-                "snap_emergency_allotment": {str(year): False},
+        # Convert annual totals to monthly amounts in one array operation
+        monthly = (
+            np.stack([values[var] for var in MONTHLY_OUTPUTS.values()]) / 12
+        )
+
+        results = []
+        for i in range(len(households)):
+            result = {
+                "year": year,
+                "employment_income": employment_income[i],
+                "tanf_benefit": values["tanf"][i] if include_tanf[i] else 0,
+                "snap_earned_income": values["snap_earned_income"][i],
+                "snap_unearned_income": values["snap_unearned_income"][i],
             }
-        }
+            result.update(zip(MONTHLY_OUTPUTS, monthly[:, i]))
+            result.update(
+                {
+                    "annual_benefit": values["snap"][i],
+                    "meets_gross_test": bool(
+                        values["meets_snap_gross_income_test"][i]
+                    ),
+                    "meets_net_test": bool(
+                        values["meets_snap_net_income_test"][i]
+                    ),
+                    "meets_asset_test": bool(
+                        values["meets_snap_asset_test"][i]
+                    ),
+                    "is_eligible": bool(values["is_snap_eligible"][i]),
+                }
+            )
+            results.append(result)
 
-        # Add heating/cooling expense if we want to trigger SUA
-        if trigger_sua:
-            spm_units["spm_unit"]["heating_cooling_expense"] = {str(year): 1}
+        return results
 
-        # Add dependent care if specified
-        if household.monthly_dependent_care > 0:
-            spm_units["spm_unit"]["childcare_expenses"] = {
-                str(year): household.monthly_dependent_care * 12
-            }
+    def _build_batch_situation(
+        self,
+        households: List[SNAPHousehold],
+        year: int,
+        trigger_sua: List[bool],
+    ) -> Dict:
+        """Combine per-household situations into a single situation.
 
-        # Build complete situation
+        Every entity is suffixed with the household's index so the
+        resulting arrays line up with the order of ``households``.
+        """
         situation = {
-            "people": people,
-            "families": {"family": {"members": members}},
-            "marital_units": marital_units,
-            "tax_units": {"tax_unit": {"members": members}},
-            "spm_units": spm_units,
-            "households": {
-                "household": {
-                    "members": members,
-                    "state_code": {str(year): household.state},
-                }
-            },
+            "people": {},
+            "families": {},
+            "marital_units": {},
+            "tax_units": {},
+            "spm_units": {},
+            "households": {},
         }
 
+        for i, (household, sua) in enumerate(zip(households, trigger_sua)):
+            single = self._build_situation(household, year, sua)
+            for name, person in single["people"].items():
+                situation["people"][f"{name}_{i}"] = person
+            for group in list(situation)[1:]:
+                for name, entity in single[group].items():
+                    situation[group][f"{name}_{i}"] = {
+                        **entity,
+                        "members": [
+                            f"{member}_{i}" for member in entity["members"]
+                        ],
+                    }
+
         return situation
+
+    def _build_situation(
+        self, household: SNAPHousehold, year: int, trigger_sua: bool
+    ) -> Dict:
+        """Build PolicyEngine simulation situation from household data."""
+        # Situations are cached in serialized form so repeated households
+        # skip the build while every caller still gets its own copy
+        return orjson.loads(_situation_json(household, year, trigger_sua))
+
+
+@lru_cache(maxsize=1024)
+def _calculate_single(
+    household: SNAPHousehold, year: int, include_tanf: bool, trigger_sua: bool
+) -> Dict:
+    """Run one household through PolicyEngine, memoized per input."""
+    return PolicyEngineCalculator().calculate_batch(
+        [household],
+        year=year,
+        include_tanf=include_tanf,
+        trigger_sua=trigger_sua,
+    )[0]
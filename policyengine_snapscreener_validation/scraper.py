@@ -1,13 +1,123 @@
 """Web scraper for SNAP screener using Playwright"""
 
 import re
-import time
 from typing import Dict, Optional
 
-from playwright.sync_api import Page, sync_playwright
+from playwright.sync_api import Browser, Page, Route, sync_playwright
 
 from .calculator import SNAPHousehold
 
+# Phrases announcing the benefit amount, tried in order
+_BENEFIT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"may be \$(\d+)",
+        r"benefit.*?\$(\d+)",
+        r"\$(\d+).*?per month",
+        r"could receive.*?\$(\d+)",
+        r"estimated.*?\$(\d+)",
+        r"eligible for.*?\$(\d+)",
+    )
+]
+_GROSS_RE = re.compile(r"gross income.*?\$(\d+)", re.IGNORECASE)
+_NET_RE = re.compile(r"net income.*?\$(\d+)", re.IGNORECASE)
+_INELIG_RE = re.compile(r"not eligible|ineligible", re.IGNORECASE)
+
+# Requests the scraper never reads, aborted before they hit the network.
+# Stylesheets still load since the scraper relies on element visibility.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_TRACKER_RE = re.compile(r"google-analytics|googletagmanager|doubleclick|gtag")
+
+# Any text the result parser recognises, tested in the page while waiting
+_RESULT_TEXT_PATTERN = "|".join(
+    [pattern.pattern for pattern in _BENEFIT_PATTERNS] + [_INELIG_RE.pattern]
+)
+
+# True once the page has changed from the submitted form and shows
+# text matching the pattern above
+_HAS_RESULT_TEXT_JS = """
+([source, formText]) => {
+    const text = document.body.innerText;
+    return text !== formText && new RegExp(source, "i").test(text);
+}
+"""
+
+# Fill inputs by position in one round trip. Values go through the native
+# setter so framework-controlled inputs see the change events.
+_FILL_INPUTS_JS = """
+([selector, values]) => {
+    const inputs = document.querySelectorAll(selector);
+    if (inputs.length < values.length) return false;
+    const setValue = Object.getOwnPropertyDescriptor(
+        HTMLInputElement.prototype, "value"
+    ).set;
+    values.forEach((value, i) => {
+        setValue.call(inputs[i], value);
+        inputs[i].dispatchEvent(new Event("input", {bubbles: true}));
+        inputs[i].dispatchEvent(new Event("change", {bubbles: true}));
+    });
+    return true;
+}
+"""
+
+# Click the first visible button whose text contains one of the labels,
+# trying labels in order. Returns the matched label or null.
+_CLICK_BUTTON_JS = """
+(labels) => {
+    // Same test as Playwright's is_visible(), which also counts
+    // position: fixed elements
+    const visible = (el) => {
+        const box = el.getBoundingClientRect();
+        return (
+            box.width > 0 &&
+            box.height > 0 &&
+            getComputedStyle(el).visibility !== "hidden"
+        );
+    };
+    const buttons = [...document.querySelectorAll("button")].filter(visible);
+    for (const label of labels) {
+        const text = label.toLowerCase();
+        const button = buttons.find(
+            (b) => b.innerText.toLowerCase().includes(text)
+        );
+        if (button) {
+            button.click();
+            return label;
+        }
+    }
+    return null;
+}
+"""
+
+# Answer "no" to every visible yes/no question and optionally tick the
+# heating/cooling checkbox, all in one round trip
+_ANSWER_QUESTIONS_JS = """
+(checkHeating) => {
+    // Same test as Playwright's is_visible(), which also counts
+    // position: fixed elements
+    const visible = (el) => {
+        const box = el.getBoundingClientRect();
+        return (
+            box.width > 0 &&
+            box.height > 0 &&
+            getComputedStyle(el).visibility !== "hidden"
+        );
+    };
+    const radios = document.querySelectorAll(
+        'input[type="radio"][value="false"]:not(:checked)'
+    );
+    radios.forEach((radio) => {
+        if (visible(radio)) radio.click();
+    });
+    if (!checkHeating) return;
+    const heating = document.querySelector(
+        'input[type="checkbox"][name*="heating"], ' +
+        'input[type="checkbox"][value*="heating"]'
+    );
+    if (heating && visible(heating) && !heating.checked) heating.click();
+}
+"""
+
 
 class SNAPScreenerScraper:
     """Scrapes SNAP screener website for benefit calculations using
@@ -15,6 +125,18 @@ class SNAPScreenerScraper:
 
     BASE_URL = "https://www.snapscreener.com"
 
+    # Button labels that open the form and submit it, tried in order
+    START_BUTTONS = ["Get Started", "Start", "Begin", "Check Eligibility"]
+    SUBMIT_BUTTONS = ["Calculate", "Get Results", "Submit", "Check"]
+
+    # Elements whose appearance marks each step as ready
+    PAGE_READY_SELECTOR = "select, input, button"
+    FORM_INPUT_SELECTOR = 'input[type="number"], input[type="text"]'
+    FORM_READY_SELECTOR = ", ".join(
+        [FORM_INPUT_SELECTOR]
+        + [f'button:has-text("{label}")' for label in START_BUTTONS]
+    )
+
     def __init__(self, headless: bool = True, timeout: int = 30000):
         """
         Initialize the scraper.
@@ -25,46 +147,105 @@ class SNAPScreenerScraper:
         """
         self.headless = headless
         self.timeout = timeout
+        self._playwright = None
+        self._browser = None
+
+    def __enter__(self) -> "SNAPScreenerScraper":
+        self._ensure_started()
+        return self
 
-    def calculate(self, household: SNAPHousehold) -> Optional[Dict]:
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _ensure_started(self) -> Browser:
+        """Launch the shared browser on first use."""
+        if self._browser is None:
+            self._playwright = sync_playwright().start()
+            try:
+                self._browser = self._playwright.chromium.launch(
+                    headless=self.headless
+                )
+            except Exception:
+                self.close()
+                raise
+        return self._browser
+
+    def close(self) -> None:
+        """Shut down the shared browser, if it was started."""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def calculate(
+        self,
+        household: SNAPHousehold,
+        unearned_income_override: Optional[float] = None,
+    ) -> Optional[Dict]:
         """
         Calculate SNAP benefits by scraping the screener website.
 
         Args:
             household: Household configuration
+            unearned_income_override: Monthly unearned income to enter in
+                place of the household's, e.g. with TANF added
 
         Returns:
             Dictionary with scraped results or None if failed
         """
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            page = browser.new_page()
-            page.set_default_timeout(self.timeout)
+        unearned_income = (
+            household.monthly_unearned_income
+            if unearned_income_override is None
+            else unearned_income_override
+        )
+
+        # Each call gets a fresh context on the long-lived browser, so
+        # only the first call pays for launching Chromium
+        context = self._ensure_started().new_context()
+        context.route("**/*", self._route_request)
+        page = context.new_page()
+        page.set_default_timeout(self.timeout)
 
+        try:
+            result = self._run_calculation(page, household, unearned_income)
+            return result
+        except Exception as e:
+            print(f"Scraping error: {e}")
+            return None
+        finally:
             try:
-                result = self._run_calculation(page, household)
-                return result
+                context.close()
             except Exception as e:
-                print(f"Scraping error: {e}")
-                return None
-            finally:
-                browser.close()
+                # A crashed browser must not mask the result being returned
+                print(f"Failed to close browser context: {e}")
+
+    @staticmethod
+    def _route_request(route: Route) -> None:
+        """Abort asset and analytics requests, continue the rest."""
+        request = route.request
+        blocked = request.resource_type in _BLOCKED_RESOURCE_TYPES
+        if blocked or _TRACKER_RE.search(request.url):
+            route.abort()
+        else:
+            route.continue_()
 
     def _run_calculation(
-        self, page: Page, household: SNAPHousehold
+        self, page: Page, household: SNAPHousehold, unearned_income: float
     ) -> Optional[Dict]:
         """Run the actual calculation on the website."""
 
         # Navigate to the screener
-        page.goto(self.BASE_URL)
-        page.wait_for_load_state("networkidle")
+        page.goto(self.BASE_URL, wait_until="domcontentloaded")
+        page.wait_for_selector(self.PAGE_READY_SELECTOR)
 
         # Select state
         if not self._select_state(page, household.state):
             return None
 
         # Fill out the form
-        if not self._fill_form(page, household):
+        if not self._fill_form(page, household, unearned_income):
             return None
 
         # Submit and get results
@@ -88,89 +269,55 @@ class SNAPScreenerScraper:
             state_select = page.locator("select").first
             if state_select.is_visible():
                 state_select.select_option(label=state_name)
-                time.sleep(1)
                 return True
 
             # Try clicking state link
             state_link = page.locator(f'text="{state_name}"').first
             if state_link.is_visible():
                 state_link.click()
-                page.wait_for_load_state("networkidle")
+                page.wait_for_load_state("domcontentloaded")
                 return True
 
             # Try direct URL
-            page.goto(f"{self.BASE_URL}/screener?state={state}")
-            page.wait_for_load_state("networkidle")
+            page.goto(
+                f"{self.BASE_URL}/screener?state={state}",
+                wait_until="domcontentloaded",
+            )
             return True
 
         except Exception as e:
             print(f"Failed to select state: {e}")
             return False
 
-    def _fill_form(self, page: Page, household: SNAPHousehold) -> bool:
+    def _fill_form(
+        self, page: Page, household: SNAPHousehold, unearned_income: float
+    ) -> bool:
         """Fill out the SNAP screener form."""
         try:
-            # Wait for form to be ready
-            time.sleep(2)
+            # Wait for the form, or the button that opens it, to render
+            # after the state change
+            page.wait_for_selector(self.FORM_READY_SELECTOR)
 
             # Look for "Get Started" or similar button
-            start_buttons = [
-                "Get Started",
-                "Start",
-                "Begin",
-                "Check Eligibility",
+            if page.evaluate(_CLICK_BUTTON_JS, self.START_BUTTONS):
+                page.wait_for_selector(self.FORM_INPUT_SELECTOR)
+
+            # Fill inputs by position (common order), skipped if the
+            # form has fewer inputs than expected
+            values = [
+                str(household.size),
+                str(int(household.monthly_earned_income)),
+                str(int(unearned_income)),
+                str(int(household.monthly_dependent_care)),
+                str(int(household.monthly_child_support)),
+                str(int(household.monthly_rent)),
+                "0",  # Homeowners costs
             ]
-            for btn_text in start_buttons:
-                btn = page.locator(f'button:has-text("{btn_text}")').first
-                if btn.is_visible():
-                    btn.click()
-                    time.sleep(2)
-                    break
-
-            # Try to fill inputs by position (common order)
-            inputs = page.locator(
-                'input[type="number"], input[type="text"]'
-            ).all()
-
-            if len(inputs) >= 7:
-                # Household size
-                inputs[0].fill(str(household.size))
-
-                # Monthly earned income
-                inputs[1].fill(str(int(household.monthly_earned_income)))
-
-                # Monthly unearned income
-                inputs[2].fill(str(int(household.monthly_unearned_income)))
-
-                # Dependent care
-                inputs[3].fill(str(int(household.monthly_dependent_care)))
-
-                # Child support
-                inputs[4].fill(str(int(household.monthly_child_support)))
-
-                # Rent
-                inputs[5].fill(str(int(household.monthly_rent)))
-
-                # Homeowners costs
-                inputs[6].fill("0")
-
-            # Handle radio buttons (elderly/disabled, student, homeless)
-            radio_buttons = page.locator(
-                'input[type="radio"][value="false"]'
-            ).all()
-            for radio in radio_buttons:
-                if radio.is_visible():
-                    radio.click()
-
-            # Handle utility checkboxes if needed
-            if household.has_utility_expenses:
-                # Check heating/cooling to trigger SUA
-                heating_checkbox = page.locator(
-                    'input[type="checkbox"][name*="heating"], '
-                    'input[type="checkbox"][value*="heating"]'
-                ).first
-                if heating_checkbox.is_visible():
-                    heating_checkbox.check()
+            page.evaluate(_FILL_INPUTS_JS, [self.FORM_INPUT_SELECTOR, values])
+
+            # Handle radio buttons (elderly/disabled, student, homeless),
+            # checking heating/cooling to trigger SUA if needed
+            page.evaluate(_ANSWER_QUESTIONS_JS, household.has_utility_expenses)
 
             return True
 
@@ -181,35 +328,26 @@ class SNAPScreenerScraper:
     def _get_results(self, page: Page) -> Optional[Dict]:
         """Submit form and extract results."""
         try:
-            # Submit the form
-            submit_buttons = ["Calculate", "Get Results", "Submit", "Check"]
-            for btn_text in submit_buttons:
-                btn = page.locator(f'button:has-text("{btn_text}")').first
-                if btn.is_visible():
-                    btn.click()
-                    break
-
-            # Wait for results
-            time.sleep(3)
-            page.wait_for_load_state("networkidle")
+            # Submit the form, remembering its text so that phrases
+            # already on it aren't mistaken for results
+            form_text = page.inner_text("body")
+            if not page.evaluate(_CLICK_BUTTON_JS, self.SUBMIT_BUTTONS):
+                print("Failed to get results: no submit button found")
+                return None
+
+            # Wait for new text the patterns below can parse
+            page.wait_for_function(
+                _HAS_RESULT_TEXT_JS, arg=[_RESULT_TEXT_PATTERN, form_text]
+            )
 
             # Extract benefit amount
             page_text = page.inner_text("body")
 
             # Look for benefit amount patterns
-            patterns = [
-                r"may be \$(\d+)",
-                r"benefit.*?\$(\d+)",
-                r"\$(\d+).*?per month",
-                r"could receive.*?\$(\d+)",
-                r"estimated.*?\$(\d+)",
-                r"eligible for.*?\$(\d+)",
-            ]
-
-            for pattern in patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                if matches:
-                    benefit = int(matches[0])
+            for pattern in _BENEFIT_PATTERNS:
+                match = pattern.search(page_text)
+                if match:
+                    benefit = int(match.group(1))
 
                     # Extract other details if available
                     result = {
@@ -219,25 +357,18 @@ class SNAPScreenerScraper:
                     }
 
                     # Try to extract gross/net income if shown
-                    gross_match = re.search(
-                        r"gross income.*?\$(\d+)", page_text, re.IGNORECASE
-                    )
+                    gross_match = _GROSS_RE.search(page_text)
                     if gross_match:
                         result["gross_income"] = int(gross_match.group(1))
 
-                    net_match = re.search(
-                        r"net income.*?\$(\d+)", page_text, re.IGNORECASE
-                    )
+                    net_match = _NET_RE.search(page_text)
                     if net_match:
                         result["net_income"] = int(net_match.group(1))
 
                     return result
 
             # Check if not eligible
-            if (
-                "not eligible" in page_text.lower()
-                or "ineligible" in page_text.lower()
-            ):
+            if _INELIG_RE.search(page_text):
                 return {
                     "benefit_amount": 0,
                     "is_eligible": False,
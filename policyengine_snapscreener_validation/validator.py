@@ -1,8 +1,12 @@
 """Main validation class for comparing PolicyEngine with SNAP screener"""
 
-from dataclasses import replace
-from typing import Dict, List
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 from tabulate import tabulate
 
@@ -11,22 +15,64 @@ from .policyengine import PolicyEngineCalculator
 from .scraper import SNAPScreenerScraper
 
 
+def _calculate_policyengine_chunk(
+    households: List[SNAPHousehold],
+    year: int,
+    include_tanf: List[bool],
+    trigger_sua: List[bool],
+) -> List[Dict]:
+    """Run one chunk of households through PolicyEngine (worker entry)."""
+    return PolicyEngineCalculator().calculate_batch(
+        households,
+        year=year,
+        include_tanf=include_tanf,
+        trigger_sua=trigger_sua,
+    )
+
+
 class SNAPValidator:
     """Validates PolicyEngine calculations against SNAP screener"""
 
-    def __init__(self, use_scraper: bool = False, headless: bool = True):
+    # Minimum households per worker process. A batched simulation grows
+    # slowly with size, so smaller chunks lose more to worker start-up
+    # than they gain from extra cores.
+    MIN_SCENARIOS_PER_WORKER = 5000
+
+    # Result details reported from both sides as flat scenario columns
+    DETAIL_FIELDS = ("gross_income", "net_income", "is_eligible")
+
+    def __init__(
+        self,
+        use_scraper: bool = False,
+        headless: bool = True,
+        scraper_workers: int = 4,
+    ):
         """
         Initialize the validator.
 
         Args:
             use_scraper: Whether to use web scraper for SNAP screener
             headless: Run browser in headless mode (if using scraper)
+            scraper_workers: Browsers scraping in parallel in
+                validate_scenarios
         """
         self.screener_calc = SNAPScreenerCalculator()
         self.policyengine_calc = PolicyEngineCalculator()
         self.scraper = (
             SNAPScreenerScraper(headless=headless) if use_scraper else None
         )
+        self.scraper_workers = scraper_workers
+
+    def __enter__(self) -> "SNAPValidator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the scraper's browser, if it was started."""
+        if self.scraper:
+            self.scraper.close()
 
     def validate_single(
         self,
@@ -50,27 +96,31 @@ class SNAPValidator:
             trigger_sua=trigger_sua,
         )
 
+        return self._compare(household, pe_result, include_tanf, use_scraper)
+
+    def _compare(
+        self,
+        household: SNAPHousehold,
+        pe_result: Dict,
+        include_tanf: bool,
+        use_scraper: bool,
+    ) -> Dict:
+        """Run the screener and compare it against a PolicyEngine result."""
         # If PolicyEngine calculated TANF, add it as unearned income
-        household_for_screener = household
+        unearned_income = household.monthly_unearned_income
         if include_tanf and pe_result.get("tanf_benefit", 0) > 0:
-            # Create a modified household with TANF as unearned income
-            household_for_screener = replace(
-                household,
-                monthly_unearned_income=household.monthly_unearned_income
-                + (pe_result["tanf_benefit"] / 12),
-            )
+            unearned_income += pe_result["tanf_benefit"] / 12
 
         # Calculate using SNAP screener methodology
+        screener_result = None
         if use_scraper and self.scraper:
-            screener_result = self.scraper.calculate(household_for_screener)
-            if screener_result is None:
-                # Fall back to calculator
-                screener_result = self.screener_calc.calculate(
-                    household_for_screener
-                )
-        else:
+            screener_result = self.scraper.calculate(
+                household, unearned_income_override=unearned_income
+            )
+        if screener_result is None:
+            # Calculator, or fallback when scraping fails
             screener_result = self.screener_calc.calculate(
-                household_for_screener
+                household, unearned_income_override=unearned_income
             )
 
         # Compare results
@@ -103,6 +153,10 @@ class SNAPValidator:
         """
         Validate multiple scenarios.
 
+        Large batches are simulated in spawned worker processes, so
+        scripts calling this must guard their entry point with
+        ``if __name__ == "__main__":``.
+
         Args:
             scenarios: List of scenario configurations
             year: Tax year for calculations
@@ -110,27 +164,172 @@ class SNAPValidator:
         Returns:
             DataFrame with comparison results
         """
-        results = []
+        households = [
+            SNAPHousehold(**scenario.get("household", {}))
+            for scenario in scenarios
+        ]
+        options = [scenario.get("options", {}) for scenario in scenarios]
 
-        for scenario in scenarios:
-            household = SNAPHousehold(**scenario.get("household", {}))
-            options = scenario.get("options", {})
+        pe_results = self._calculate_policyengine(
+            households,
+            year,
+            [opts.get("include_tanf", True) for opts in options],
+            [opts.get("trigger_sua", False) for opts in options],
+        )
 
-            comparison = self.validate_single(
-                household,
-                year=year,
-                include_tanf=options.get("include_tanf", True),
-                trigger_sua=options.get("trigger_sua", False),
-                use_scraper=options.get("use_scraper", False),
+        # TANF is only reported when it was included for the scenario
+        tanf = np.array(
+            [pe_result["tanf_benefit"] for pe_result in pe_results],
+            dtype=float,
+        )
+        pe_benefit = np.array(
+            [pe_result["benefit_amount"] for pe_result in pe_results]
+        )
+
+        # Screen every household at once, adding TANF as unearned income
+        batch_arguments = self.screener_calc.BATCH_ARGUMENTS
+        inputs = {
+            argument: np.array(
+                [getattr(household, field) for household in households]
+            )
+            for argument, field in batch_arguments.items()
+        }
+        inputs["unearned_income"] = inputs["unearned_income"] + tanf / 12
+        screener = self.screener_calc.calculate_batch(**inputs)
+
+        # Replace calculator results with scraped ones where requested
+        if self.scraper:
+            to_scrape = [
+                i
+                for i, opts in enumerate(options)
+                if opts.get("use_scraper", False)
+            ]
+            scraped = self._scrape(
+                [households[i] for i in to_scrape],
+                inputs["unearned_income"][to_scrape],
+            )
+            for i, result in zip(to_scrape, scraped):
+                if result is None:
+                    continue
+                screener["benefit_amount"][i] = result["benefit_amount"]
+                screener["is_eligible"][i] = result["is_eligible"]
+                # Scraped pages may not show the income figures
+                for key in ("gross_income", "net_income"):
+                    screener[key][i] = result.get(key, np.nan)
+
+        screener_benefit = screener["benefit_amount"]
+
+        columns = {
+            "household_size": inputs["sizes"],
+            "monthly_income": inputs["earned_income"],
+            "monthly_rent": inputs["rent"],
+            "screener_benefit": screener_benefit,
+            "policyengine_benefit": pe_benefit,
+            "difference": pe_benefit - screener_benefit,
+            "tanf_included": tanf > 0,
+            "tanf_amount": tanf / 12,
+        }
+        for field in self.DETAIL_FIELDS:
+            columns[f"screener_{field}"] = screener[field]
+        for field in self.DETAIL_FIELDS:
+            columns[f"policyengine_{field}"] = np.array(
+                [pe_result[field] for pe_result in pe_results]
             )
 
-            # Add scenario name if provided
-            if "name" in scenario:
-                comparison["scenario"] = scenario["name"]
+        # Add scenario names if provided
+        if any("name" in scenario for scenario in scenarios):
+            columns["scenario"] = [
+                scenario.get("name") for scenario in scenarios
+            ]
+
+        return pd.DataFrame(columns)
+
+    def _scrape(
+        self, households: List[SNAPHousehold], unearned_income: np.ndarray
+    ) -> List[Optional[Dict]]:
+        """Scrape households in parallel, one browser per worker thread."""
+        results = [None] * len(households)
+        pending = queue.SimpleQueue()
+        for item in enumerate(zip(households, unearned_income)):
+            pending.put(item)
+
+        def work():
+            # Playwright's sync API is bound to the thread that started
+            # it, so each worker drives its own browser
+            with SNAPScreenerScraper(
+                headless=self.scraper.headless,
+                timeout=self.scraper.timeout,
+            ) as scraper:
+                while True:
+                    try:
+                        i, (household, unearned) = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    results[i] = scraper.calculate(
+                        household, unearned_income_override=unearned
+                    )
+
+        workers = min(self.scraper_workers, len(households))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            futures = [executor.submit(work) for _ in range(workers)]
+            for future in futures:
+                future.result()
+
+        return results
+
+    def _calculate_policyengine(
+        self,
+        households: List[SNAPHousehold],
+        year: int,
+        include_tanf: List[bool],
+        trigger_sua: List[bool],
+    ) -> List[Dict]:
+        """Run households through PolicyEngine, across processes if large."""
+        # Repeated scenarios only need simulating once
+        keys = list(zip(households, include_tanf, trigger_sua))
+        unique = list(dict.fromkeys(keys))
+        if len(unique) < len(keys):
+            unique_households, unique_tanf, unique_sua = map(
+                list, zip(*unique)
+            )
+            unique_results = self._calculate_policyengine(
+                unique_households, year, unique_tanf, unique_sua
+            )
+            results = dict(zip(unique, unique_results))
+            return [dict(results[key]) for key in keys]
+
+        workers = min(
+            os.cpu_count() or 1,
+            len(households) // self.MIN_SCENARIOS_PER_WORKER,
+        )
 
-            results.append(comparison)
+        # Small batches run as a single simulation in this process
+        if workers <= 1:
+            return self.policyengine_calc.calculate_batch(
+                households,
+                year=year,
+                include_tanf=include_tanf,
+                trigger_sua=trigger_sua,
+            )
 
-        return pd.DataFrame(results)
+        # Split into contiguous chunks so results keep scenario order
+        bounds = [len(households) * i // workers for i in range(workers + 1)]
+        chunks = [slice(start, end) for start, end in zip(bounds, bounds[1:])]
+
+        # Spawn fresh interpreters: forking after PolicyEngine and Numba
+        # have started their threads can deadlock the parent on exit
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            chunk_results = executor.map(
+                _calculate_policyengine_chunk,
+                [households[chunk] for chunk in chunks],
+                [year] * workers,
+                [include_tanf[chunk] for chunk in chunks],
+                [trigger_sua[chunk] for chunk in chunks],
+            )
+            return [result for chunk in chunk_results for result in chunk]
 
     def print_comparison(self, comparison: Dict):
         """Print a formatted comparison of results."""
@@ -225,7 +424,7 @@ class SNAPValidator:
         ]
         for col in currency_cols:
             if col in display_df.columns:
-                display_df[col] = display_df[col].apply(lambda x: f"${x:,.0f}")
+                display_df[col] = display_df[col].map("${:,.0f}".format)
 
         # Print table
         print("\n" + "=" * 100)
@@ -1,5 +1,7 @@
 """Tests for SNAP screener calculator"""
 
+import numpy as np
+
 from policyengine_snapscreener_validation.calculator import (
     SNAPHousehold,
     SNAPScreenerCalculator,
@@ -115,3 +117,92 @@ class TestSNAPScreenerCalculator:
 
         # Benefit should be higher with utility allowance
         assert result_with["benefit_amount"] > result_without["benefit_amount"]
+
+    def test_unearned_income_override(self):
+        """Test that the override replaces the household's unearned income"""
+        household = SNAPHousehold(
+            size=3,
+            monthly_earned_income=1500,
+            monthly_unearned_income=0,
+            monthly_rent=1000,
+        )
+        household_with_tanf = SNAPHousehold(
+            size=3,
+            monthly_earned_income=1500,
+            monthly_unearned_income=400,
+            monthly_rent=1000,
+        )
+
+        result = self.calculator.calculate(
+            household, unearned_income_override=400
+        )
+
+        assert result == self.calculator.calculate(household_with_tanf)
+
+    def test_calculate_batch_matches_scalar(self):
+        """Test that batch calculation matches per-household results"""
+        households = [
+            SNAPHousehold(
+                size=1,
+                monthly_earned_income=1000,
+                monthly_unearned_income=0,
+                monthly_rent=800,
+            ),
+            SNAPHousehold(
+                size=4,
+                monthly_earned_income=2500,
+                monthly_unearned_income=300,
+                monthly_rent=1500,
+                has_utility_expenses=True,
+            ),
+            SNAPHousehold(
+                size=10,
+                monthly_earned_income=3000,
+                monthly_unearned_income=0,
+                monthly_rent=1200,
+                monthly_medical_expenses=100,
+                has_elderly_disabled=True,
+            ),
+        ]
+
+        results = self.calculator.calculate_batch(
+            sizes=np.array([h.size for h in households]),
+            earned_income=np.array(
+                [h.monthly_earned_income for h in households]
+            ),
+            unearned_income=np.array(
+                [h.monthly_unearned_income for h in households]
+            ),
+            rent=np.array([h.monthly_rent for h in households]),
+            medical_expenses=np.array(
+                [h.monthly_medical_expenses for h in households]
+            ),
+            has_elderly_disabled=np.array(
+                [h.has_elderly_disabled for h in households]
+            ),
+            has_utility_expenses=np.array(
+                [h.has_utility_expenses for h in households]
+            ),
+        )
+
+        for i, household in enumerate(households):
+            expected = self.calculator.calculate(household)
+            for key, value in expected.items():
+                assert results[key][i] == value
+
+    def test_calculate_batch_scalars(self):
+        """Test that all-scalar batch inputs give a batch of one"""
+        household = SNAPHousehold(
+            size=3,
+            monthly_earned_income=1000,
+            monthly_unearned_income=0,
+            monthly_rent=500,
+        )
+
+        results = self.calculator.calculate_batch(3, 1000.0, 0, 500)
+
+        assert results["benefit_amount"].shape == (1,)
+        assert (
+            results["benefit_amount"][0]
+            == self.calculator.calculate(household)["benefit_amount"]
+        )
@@ -146,3 +146,38 @@ class TestPolicyEngineCalculator:
 
             assert result["benefit_amount"] >= 0
             assert "is_eligible" in result
+
+    def test_calculate_batch_matches_single(self):
+        """Test that a batched simulation matches individual ones"""
+        households = [
+            SNAPHousehold(
+                size=4,
+                monthly_earned_income=2500,
+                monthly_unearned_income=0,
+                monthly_rent=1500,
+                state="CA",
+            ),
+            SNAPHousehold(
+                size=1,
+                monthly_earned_income=1500,
+                monthly_unearned_income=0,
+                monthly_rent=1000,
+                state="NY",
+            ),
+        ]
+
+        results = self.calculator.calculate_batch(
+            households, include_tanf=[True, False], trigger_sua=[False, True]
+        )
+
+        assert len(results) == 2
+        expected = [
+            self.calculator.calculate(households[0], include_tanf=True),
+            self.calculator.calculate(
+                households[1], include_tanf=False, trigger_sua=True
+            ),
+        ]
+        for result, single in zip(results, expected):
+            assert result["benefit_amount"] == single["benefit_amount"]
+            assert result["tanf_benefit"] == single["tanf_benefit"]
+            assert result["is_eligible"] == single["is_eligible"]
@@ -1,13 +1,50 @@
 """Tests for the validator module"""
 
+import threading
+import time
+
 import pandas as pd
 
 from policyengine_snapscreener_validation import (
     SNAPHousehold,
     SNAPValidator,
+    validator,
 )
 
 
+class FakeScraper:
+    """Stands in for SNAPScreenerScraper without launching a browser"""
+
+    def __init__(self, headless=True, timeout=30000):
+        self.headless = headless
+        self.timeout = timeout
+        self.thread = None
+
+    def __enter__(self):
+        self.thread = threading.get_ident()
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def close(self):
+        pass
+
+    def calculate(self, household, unearned_income_override=None):
+        # Each worker must only use the scraper it opened
+        assert threading.get_ident() == self.thread
+
+        # Later households finish first, so results arrive out of order
+        time.sleep((2000 - household.monthly_rent) / 20000)
+        if household.monthly_rent == 1300:
+            return None  # Failed scrape
+        return {
+            "benefit_amount": int(household.monthly_rent),
+            "is_eligible": True,
+            "source": "snapscreener.com",
+        }
+
+
 class TestSNAPValidator:
     """Test the main validator class"""
 
@@ -118,6 +155,94 @@ class TestSNAPValidator:
         assert "scenario" in df.columns
         assert df.iloc[0]["scenario"] == "Low income"
         assert df.iloc[1]["scenario"] == "High income"
+        assert df["policyengine_is_eligible"].dtype == bool
+        assert df["screener_gross_income"].iloc[1] == 5000
+
+    def test_validate_scenarios_repeated(self):
+        """Test that repeated scenarios give identical rows"""
+        scenario = {
+            "household": {
+                "size": 3,
+                "monthly_earned_income": 1800,
+                "monthly_unearned_income": 0,
+                "monthly_rent": 1100,
+            }
+        }
+        df = self.validator.validate_scenarios([scenario, scenario])
+
+        assert len(df) == 2
+        assert df["policyengine_benefit"].nunique() == 1
+        assert df["screener_benefit"].nunique() == 1
+
+    def test_validate_scenarios_scraper(self, monkeypatch):
+        """Test parallel scraping keeps order and falls back on failure"""
+        monkeypatch.setattr(validator, "SNAPScreenerScraper", FakeScraper)
+        scraping_validator = SNAPValidator(use_scraper=True, scraper_workers=3)
+        scenarios = [
+            {
+                "household": {
+                    "size": 2,
+                    "monthly_earned_income": 1000,
+                    "monthly_unearned_income": 0,
+                    "monthly_rent": rent,
+                },
+                "options": {
+                    "include_tanf": False,
+                    "use_scraper": rent != 1400,
+                },
+            }
+            for rent in range(1000, 1600, 100)
+        ]
+
+        df = scraping_validator.validate_scenarios(scenarios)
+
+        # Failed and unscraped rows keep the calculator's benefit
+        calculated = {
+            rent: scraping_validator.screener_calc.calculate(
+                SNAPHousehold(
+                    size=2,
+                    monthly_earned_income=1000,
+                    monthly_unearned_income=0,
+                    monthly_rent=rent,
+                )
+            )["benefit_amount"]
+            for rent in (1300, 1400)
+        }
+        assert list(df["screener_benefit"]) == [
+            1000,
+            1100,
+            1200,
+            calculated[1300],
+            calculated[1400],
+            1500,
+        ]
+
+    def test_calculate_policyengine_processes(self, monkeypatch):
+        """Test that worker processes keep scenario order and values"""
+        monkeypatch.setattr(SNAPValidator, "MIN_SCENARIOS_PER_WORKER", 1)
+        monkeypatch.setattr(validator.os, "cpu_count", lambda: 2)
+        households = [
+            SNAPHousehold(
+                size=size,
+                monthly_earned_income=income,
+                monthly_unearned_income=0,
+                monthly_rent=1200,
+            )
+            for size, income in ((1, 800), (3, 2000), (4, 1500))
+        ]
+        include_tanf = [False, True, False]
+        trigger_sua = [False, False, True]
+
+        results = self.validator._calculate_policyengine(
+            households, 2025, include_tanf, trigger_sua
+        )
+
+        assert results == self.validator.policyengine_calc.calculate_batch(
+            households,
+            year=2025,
+            include_tanf=include_tanf,
+            trigger_sua=trigger_sua,
+        )
 
     def test_print_comparison(self, capsys):
         """Test that print_comparison outputs correctly"""